@@ -16,6 +16,7 @@ from machine import Pin, ADC, reset
 import neopixel
 import random
 import math
+import json
 import os
 import config
 
@@ -47,6 +48,20 @@ CONSECUTIVE_READINGS_NEEDED = 25
 SETTINGS_REFRESH_ITERATIONS = 10000
 ANIMATION_SPEED = 0.05
 
+# Animation phase is tracked as a 16-bit fixed-point angle (0..65535
+# maps onto 0..2*pi): advancing it is an int add+mask per frame instead
+# of a soft-float add and modulo on the FP-less RP2040, and sines come
+# from a 256-entry table indexed by the top byte of the phase
+PHASE_MASK = 0xFFFF
+PHASE_STEP = int(ANIMATION_SPEED * 65536 / (2 * math.pi))
+SINE_LUT = tuple(math.sin(i * 2 * math.pi / 256) for i in range(256))
+
+# exp(-t) sampled in 1/32 steps on t in [0, 8): the breathing Gaussian
+# only needs exp() of non-positive arguments, and past t=8 the result
+# rounds to a dark pixel anyway, so a 256-entry table replaces the libm
+# call with a load and a bounds check
+EXP_LUT = tuple(math.exp(-i * 0.03125) for i in range(256))
+
 # Colors
 COLOR_ERROR = (255, 0, 0)
 COLOR_ERROR_WIFI = (255, 165, 0)
@@ -63,41 +78,75 @@ GITHUB_RAW_URL = "https://raw.githubusercontent.com/fboucher/DaysUntilNextEvent/
 UPDATE_FILE_NEW = "main_new.py"
 UPDATE_FILE_BACKUP = "main_backup_auto.py"
 
+# Timezone Cache
+TZ_CACHE_FILE = "tz_cache.json"
+TZ_CACHE_TTL = 24 * 3600  # seconds
+
 
 # ============================================================================
 # UTILITY CLASSES
 # ============================================================================
 
 class Logger:
-    """Simple logging utility for errors and trace messages."""
-    
+    """Simple logging utility for errors and trace messages.
+
+    Messages are buffered in RAM and flushed in batches: opening and
+    appending a file per message hammers the flash filesystem, and the
+    metadata I/O dominates the cost of each write.
+    """
+
     ERROR_LOG = 'errors.log'
     TRACE_LOG = 'trace.log'
-    
+
+    FLUSH_COUNT = 20
+    FLUSH_SECONDS = 5
+
+    _buffer = []
+    _last_flush = 0
+
     @staticmethod
     def error(message):
         """Log an error message to both console and file."""
         print(f"ERROR: {message}")
         Logger._write_to_file(Logger.ERROR_LOG, message)
-    
+
     @staticmethod
     def info(message):
         """Log an info message to both console and file."""
         print(f"INFO: {message}")
         Logger._write_to_file(Logger.TRACE_LOG, message)
-    
+
     @staticmethod
     def _write_to_file(filename, message):
-        """Write a timestamped message to a file."""
-        try:
-            with open(filename, 'a') as f:
-                f.write(f"{time.time()}: {message}\n")
-        except Exception as e:
-            print(f"Failed to write to {filename}: {e}")
-    
+        """Buffer a timestamped message; flush when the batch is full."""
+        Logger._buffer.append((filename, time.time(), message))
+        if (len(Logger._buffer) >= Logger.FLUSH_COUNT or
+                time.time() - Logger._last_flush > Logger.FLUSH_SECONDS):
+            Logger.flush()
+
+    @staticmethod
+    def flush():
+        """Write all buffered messages to their log files."""
+        pending = Logger._buffer
+        Logger._buffer = []
+        Logger._last_flush = time.time()
+        if not pending:
+            return
+        for logfile in (Logger.ERROR_LOG, Logger.TRACE_LOG):
+            lines = [f"{ts}: {msg}\n" for name, ts, msg in pending if name == logfile]
+            if not lines:
+                continue
+            try:
+                with open(logfile, 'a') as f:
+                    for line in lines:
+                        f.write(line)
+            except Exception as e:
+                print(f"Failed to write to {logfile}: {e}")
+
     @staticmethod
     def clear_logs():
         """Clear all log files."""
+        Logger._buffer = []
         for logfile in [Logger.ERROR_LOG, Logger.TRACE_LOG]:
             try:
                 os.remove(logfile)
@@ -124,9 +173,14 @@ class DateUtils:
     @staticmethod
     def days_between(date1_tuple, date2_string):
         """Calculate days between two dates."""
-        date1_seconds = time.mktime(date1_tuple + (0, 0, 0, 0, 0))
         date2_seconds = time.mktime(DateUtils.string_to_datetime_tuple(date2_string))
-        return int((date2_seconds - date1_seconds) // 86400)
+        return DateUtils.days_between_epoch(date1_tuple, date2_seconds)
+
+    @staticmethod
+    def days_between_epoch(date1_tuple, epoch2):
+        """Calculate days from a date tuple to a pre-computed epoch."""
+        date1_seconds = time.mktime(date1_tuple + (0, 0, 0, 0, 0))
+        return int((epoch2 - date1_seconds) // 86400)
     
     @staticmethod
     def is_within_time_range(start_time_str, end_time_str, current_time_tuple):
@@ -144,7 +198,18 @@ class DateUtils:
         else:
             # Handle time range that spans midnight
             return current_minutes >= start_minutes or current_minutes <= end_minutes
-    
+
+    @staticmethod
+    def is_within_time_range_precomputed(start_minutes, end_minutes, current_time_tuple):
+        """Like is_within_time_range, but with pre-parsed minute values."""
+        current_minutes = current_time_tuple[3] * 60 + current_time_tuple[4]
+
+        if start_minutes <= end_minutes:
+            return start_minutes <= current_minutes <= end_minutes
+        else:
+            # Handle time range that spans midnight
+            return current_minutes >= start_minutes or current_minutes <= end_minutes
+
     @staticmethod
     def adjust_time_with_offset(time_tuple, hours_offset):
         """Adjust time tuple by timezone offset in hours."""
@@ -154,31 +219,44 @@ class DateUtils:
 
 class ColorUtils:
     """Utility functions for color manipulation."""
-    
+
+    # Parsed-color memo; the palette is a handful of distinct strings
+    # (primary, secondary, marker, errors), so this never grows
+    _RGB_CACHE = {}
+
     @staticmethod
     def string_to_rgb(rgb_string):
         """Convert '(R,G,B)' string to (r, g, b) tuple."""
-        rgb_string = rgb_string.strip("()")
-        r, g, b = map(int, rgb_string.split(","))
-        return (r, g, b)
+        rgb = ColorUtils._RGB_CACHE.get(rgb_string)
+        if rgb is None:
+            stripped = rgb_string.strip("()")
+            r, g, b = map(int, stripped.split(","))
+            rgb = (r, g, b)
+            ColorUtils._RGB_CACHE[rgb_string] = rgb
+        return rgb
     
     @staticmethod
+    @micropython.native
     def clamp(value, min_val=0, max_val=255):
         """Clamp a value between min_val and max_val."""
         return max(min(int(value), max_val), min_val)
     
     @staticmethod
     def random_base_color():
-        """Generate a random base color (0.01 to 0.99)."""
+        """Generate a random base color as 8-bit channels (3 to 252)."""
         return (
-            random.randrange(1, 99) / 100,
-            random.randrange(1, 99) / 100,
-            random.randrange(1, 99) / 100
+            random.randrange(3, 253),
+            random.randrange(3, 253),
+            random.randrange(3, 253)
         )
 
     @staticmethod
+    @micropython.native
     def lighten(color, factor):
-        """Lighten a color by a factor (1.0 = no change)."""
+        """Lighten a color by a factor (1.0 = no change).
+
+        Pure-Python fallback; hot paths should use lighten_q8 below.
+        """
         r, g, b = color
         r = ColorUtils.clamp(r * factor)
         g = ColorUtils.clamp(g * factor)
@@ -186,6 +264,40 @@ class ColorUtils:
         return (r, g, b)
 
 
+@micropython.viper
+def lighten_q8(r: int, g: int, b: int, factor_q8: int) -> int:
+    """Scale RGB channels by a Q8 fixed-point factor (256 = no change).
+
+    Compiled to native code by the viper emitter, so the per-channel
+    multiply/shift/clamp runs as integer machine ops instead of RP2040
+    soft-float. Returns the result packed as (r << 16) | (g << 8) | b.
+    """
+    rr = (r * factor_q8) >> 8
+    gg = (g * factor_q8) >> 8
+    bb = (b * factor_q8) >> 8
+    if rr > 255:
+        rr = 255
+    if gg > 255:
+        gg = 255
+    if bb > 255:
+        bb = 255
+    return (rr << 16) | (gg << 8) | bb
+
+
+# Flash lightening only ever uses factors in 1.00..1.35 (the eased
+# pulse), so quantize the factor into 16 buckets and precompute every
+# (bucket, channel value) result. Per-pixel lightening then costs three
+# indexed byte loads instead of multiply+clamp per channel.
+LIGHTEN_BUCKETS = 16
+LIGHTEN_LUT = bytearray(256 * LIGHTEN_BUCKETS)
+for _bucket in range(LIGHTEN_BUCKETS):
+    _factor = 1.0 + 0.35 * _bucket / (LIGHTEN_BUCKETS - 1)
+    for _value in range(256):
+        _scaled = int(_value * _factor)
+        LIGHTEN_LUT[_bucket * 256 + _value] = 255 if _scaled > 255 else _scaled
+del _bucket, _factor, _value, _scaled
+
+
 # ============================================================================
 # HARDWARE CLASSES
 # ============================================================================
@@ -244,21 +356,22 @@ class LightSensor:
         self.consecutive_dark_count = 0
         self.consecutive_light_count = 0
     
+    @micropython.native
     def update(self):
         """Update the sensor state and return (is_dark, consistent_dark, consistent_light)."""
         reading = self.adc.read_u16()
         is_dark = reading > self.threshold
-        
-        if is_dark:
-            self.consecutive_dark_count += 1
-            self.consecutive_light_count = 0
-        else:
-            self.consecutive_light_count += 1
-            self.consecutive_dark_count = 0
-        
+
+        # Branchless counter update: the matching counter increments and
+        # the other is zeroed by the multiply, with no compare-and-jump
+        dark = int(is_dark)
+        light = 1 - dark
+        self.consecutive_dark_count = (self.consecutive_dark_count + dark) * dark
+        self.consecutive_light_count = (self.consecutive_light_count + light) * light
+
         consistent_dark = self.consecutive_dark_count >= self.consecutive_needed
         consistent_light = self.consecutive_light_count >= self.consecutive_needed
-        
+
         return is_dark, consistent_dark, consistent_light
 
 
@@ -268,39 +381,115 @@ class LEDStripController:
     def __init__(self, pin, num_pixels):
         self.np = neopixel.NeoPixel(Pin(pin), num_pixels)
         self.num_pixels = num_pixels
-    
+        # Per-pixel byte order of the underlying buffer (GRB for WS2812)
+        self._order = getattr(self.np, 'ORDER', (1, 0, 2, 3))
+        # Pre-built byte patterns for fast buffer slice writes
+        self._progress_pattern = self._color_bytes(COLOR_PROGRESS)
+        # Segment ranges per step count, computed lazily (progress uses 10)
+        self._segment_ranges = {}
+        # Shadow of the last transmitted frame; lets write() skip the
+        # blocking transmit when nothing changed
+        self._last_buf = bytearray(len(self.np.buf))
+        # All pixel writes land in this device-order staging buffer; a
+        # single C-level blit moves it into the NeoPixel buffer at
+        # write() time, so hot loops never allocate tuples per pixel
+        self.shadow = bytearray(len(self.np.buf))
+        self._off_frame = b'\x00' * len(self.shadow)
+
+    def _segments(self, total_steps):
+        """Return cached (start, end) pixel ranges for a progress bar."""
+        ranges = self._segment_ranges.get(total_steps)
+        if ranges is None:
+            segment_size = self.num_pixels // total_steps
+            ranges = tuple(
+                (segment * segment_size,
+                 min(segment * segment_size + segment_size - 1, self.num_pixels))
+                for segment in range(total_steps)
+            )
+            self._segment_ranges[total_steps] = ranges
+        return ranges
+
+    def _color_bytes(self, color):
+        """Pack an (r, g, b) color into the strip's per-pixel byte order."""
+        raw = bytearray(3)
+        for channel in range(3):
+            raw[self._order[channel]] = color[channel]
+        return bytes(raw)
+
     def clear(self):
         """Turn off all LEDs."""
-        self.np.fill(COLOR_OFF)
-        self.np.write()
-    
+        # Fast path for the idle loop, which clears every tick: when
+        # both the staging buffer and the transmitted frame are already
+        # dark this is two C-level compares and a return
+        if self.shadow == self._off_frame and self._last_buf == self._off_frame:
+            return
+        self.shadow[:] = self._off_frame
+        self.write()
+
     def fill(self, color):
         """Fill all LEDs with a color."""
-        self.np.fill(color)
-        self.np.write()
-    
+        self.shadow[:] = self._color_bytes(color) * self.num_pixels
+        self.write()
+
+    def fill_range(self, start, end, color):
+        """Fill pixels [start, end) with a color via one slice write."""
+        self.shadow[start * 3:end * 3] = self._color_bytes(color) * (end - start)
+
+    @micropython.native
     def set_pixel(self, index, color):
         """Set a single pixel color."""
         if 0 <= index < self.num_pixels:
-            self.np[index] = color
-    
+            self._set(index, color)
+
+    def _set(self, index, color):
+        """Unchecked pixel write for hot loops; index must be in range."""
+        shadow = self.shadow
+        order = self._order
+        offset = index * 3
+        shadow[offset + order[0]] = color[0]
+        shadow[offset + order[1]] = color[1]
+        shadow[offset + order[2]] = color[2]
+
     def get_pixel(self, index):
         """Get a single pixel color."""
         if 0 <= index < self.num_pixels:
-            return self.np[index]
+            shadow = self.shadow
+            order = self._order
+            offset = index * 3
+            return (shadow[offset + order[0]],
+                    shadow[offset + order[1]],
+                    shadow[offset + order[2]])
         return COLOR_OFF
-    
+
     def write(self):
-        """Update the LED strip with current buffer."""
-        self.np.write()
+        """Blit the staging buffer and transmit if the frame changed."""
+        shadow = self.shadow
+        # bytearray compare, copy and blit all run in C - far cheaper
+        # than a full frame on the wire (~30us per pixel). A direct
+        # compare is both faster and exact, unlike hashing the buffer
+        # (e.g. crc32), which would add a pass and admit collisions
+        if shadow != self._last_buf:
+            self.np.buf[:] = shadow
+            self.np.write()
+            self._last_buf[:] = shadow
     
     def startup_animation(self):
         """Display a startup animation to verify LEDs work."""
-        # Green wave
+        # Bind to locals once: attribute lookups are dict lookups on
+        # MicroPython and add up inside per-pixel loops
+        shadow = self.shadow
+        pattern = self._progress_pattern
+        sleep_ms = time.sleep_ms
+
+        # Green wave - transmit every 4th pixel instead of every pixel;
+        # each write() is a full-strip transaction so this cuts the PIO
+        # framing overhead 4x while keeping the wave visible
         for i in range(self.num_pixels):
-            self.set_pixel(i, COLOR_PROGRESS)
-            self.write()
-            time.sleep_ms(10)
+            shadow[i * 3:i * 3 + 3] = pattern
+            if i & 3 == 3:
+                self.write()
+                sleep_ms(10)
+        self.write()
         
         time.sleep_ms(200)
         
@@ -319,16 +508,20 @@ class LEDStripController:
         """Show progress bar (1-10 segments)."""
         if not (1 <= step <= total_steps):
             return
-        
-        segment_size = self.num_pixels // total_steps
-        self.clear()
-        
+
+        shadow = self.shadow
+        pattern = self._progress_pattern
+        ranges = self._segments(total_steps)
+        # Zero the staging buffer in place; the single write() below
+        # transmits the finished frame (no blank frame on the wire)
+        shadow[:] = self._off_frame
+
         for segment in range(step):
-            segment_start = segment * segment_size
-            segment_end = segment_start + segment_size - 1  # Leave 1 LED gap
-            for i in range(segment_start, min(segment_end, self.num_pixels)):
-                self.set_pixel(i, COLOR_PROGRESS)
-        
+            segment_start, segment_end = ranges[segment]
+            # Slice assignment on the bytearray runs in C - no per-pixel loop
+            shadow[segment_start * 3:segment_end * 3] = \
+                pattern * (segment_end - segment_start)
+
         self.write()
 
 
@@ -338,7 +531,16 @@ class UpdateManager:
     def __init__(self, led_controller, current_version=VERSION):
         self.led = led_controller
         self.current_version = current_version
-    
+        self._current_tuple = UpdateManager._parse_version(current_version)
+
+    @staticmethod
+    def _parse_version(version):
+        """Parse 'X.Y.Z' into an int tuple; None if it doesn't parse."""
+        try:
+            return tuple(int(part) for part in version.strip().split('.'))
+        except (ValueError, AttributeError):
+            return None
+
     def check_and_update(self, branch="main", auto_update=True):
         """Check for updates and apply if newer version available."""
         if not auto_update:
@@ -356,8 +558,15 @@ class UpdateManager:
             
             Logger.info(f"Remote version: {remote_version}")
             
-            # Compare versions
-            if remote_version <= self.current_version:
+            # Compare versions numerically: a string compare would rank
+            # "1.0.10" below "1.0.2"
+            remote_tuple = UpdateManager._parse_version(remote_version)
+            if remote_tuple is None or self._current_tuple is None:
+                # Unparseable version - fall back to the string compare
+                if remote_version <= self.current_version:
+                    Logger.info("Already on latest version")
+                    return False
+            elif remote_tuple <= self._current_tuple:
                 Logger.info("Already on latest version")
                 return False
             
@@ -383,9 +592,10 @@ class UpdateManager:
         Logger.info(f"Fetching version from: {url}")
         
         try:
-            response = urequests.get(url)
-            if response.status_code == 200:
-                # Read first 1KB to find VERSION
+            # Only the first 1 KB is needed to find VERSION; a Range
+            # request avoids downloading (and TLS-decrypting) the rest
+            response = urequests.get(url, headers={'Range': 'bytes=0-1023'})
+            if response.status_code in (200, 206):
                 content = response.text[:1024]
                 response.close()
                 
@@ -421,25 +631,55 @@ class UpdateManager:
                 Logger.error(f"Download failed: {response.status_code}")
                 response.close()
                 return False
-            
-            content = response.text
+
+            # Step 2: Stream to flash in 512-byte chunks so the file
+            # never needs to fit in RAM; the key-component checks run on
+            # the fly over a small overlap window
+            Logger.info(f"Saving to {UPDATE_FILE_NEW}...")
+            stream = getattr(response, 'raw', None)
+            total = 0
+            has_network = False
+            has_main = False
+            tail = b''
+
+            with open(UPDATE_FILE_NEW, 'wb') as f:
+                if stream is None:
+                    # Fallback for urequests builds without raw access
+                    content = response.text.encode()
+                    f.write(content)
+                    total = len(content)
+                    has_network = b'import network' in content
+                    has_main = b'def main()' in content
+                else:
+                    while True:
+                        chunk = stream.read(512)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        total += len(chunk)
+                        # Overlap with the previous chunk's tail so a
+                        # needle split across chunks is still found
+                        window = tail + chunk
+                        if not has_network and b'import network' in window:
+                            has_network = True
+                        if not has_main and b'def main()' in window:
+                            has_main = True
+                        tail = chunk[-16:]
+
             response.close()
-            
-            # Step 2: Validate downloaded file
-            if len(content) < 1000:  # Sanity check
+
+            # Step 3: Validate the streamed file
+            if total < 1000:  # Sanity check
                 Logger.error("Downloaded file too small, aborting")
+                os.remove(UPDATE_FILE_NEW)
                 return False
-            
-            if 'import network' not in content or 'def main()' not in content:
+
+            if not has_network or not has_main:
                 Logger.error("Downloaded file missing key components")
+                os.remove(UPDATE_FILE_NEW)
                 return False
-            
-            Logger.info(f"Downloaded {len(content)} bytes")
-            
-            # Step 3: Save as new file
-            Logger.info(f"Saving to {UPDATE_FILE_NEW}...")
-            with open(UPDATE_FILE_NEW, 'w') as f:
-                f.write(content)
+
+            Logger.info(f"Downloaded {total} bytes")
             
             # Step 4: Backup current main.py
             Logger.info("Backing up current version...")
@@ -461,9 +701,10 @@ class UpdateManager:
             os.rename(UPDATE_FILE_NEW, 'main.py')
             
             Logger.info("Update complete! Rebooting...")
+            Logger.flush()
             self.led.fill(COLOR_UPDATE)
             time.sleep(2)
-            
+
             # Step 6: Reboot
             reset()
             
@@ -570,6 +811,27 @@ class TimeAPI:
         
         return None
     
+    @staticmethod
+    def load_cached_timezone():
+        """Return cached (timezone, offset) or None if missing or stale."""
+        try:
+            with open(TZ_CACHE_FILE) as f:
+                cache = json.load(f)
+            if time.time() - cache.get('ts', 0) < TZ_CACHE_TTL:
+                return cache['tz'], cache['offset']
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def save_cached_timezone(timezone, offset):
+        """Persist the timezone and offset for reuse on later boots."""
+        try:
+            with open(TZ_CACHE_FILE, 'w') as f:
+                json.dump({'tz': timezone, 'offset': offset, 'ts': time.time()}, f)
+        except Exception as e:
+            Logger.error(f"Failed to save timezone cache: {e}")
+
     @staticmethod
     def sync_ntp_time(retries=3):
         """Synchronize time with NTP server."""
@@ -618,7 +880,8 @@ class SettingsAPI:
                         is_flashing=data.get('IsFlashing', data.get('IsFlashing', True)),
                         flash_speed=data.get('flash_speed', data.get('FlashSpeed', 2)),
                         auto_update=data.get('auto_update', data.get('AutoUpdate', True)),
-                        update_branch=data.get('update_branch', data.get('UpdateBranch', 'main'))
+                        update_branch=data.get('update_branch', data.get('UpdateBranch', 'main')),
+                        force_time_refresh=data.get('ForceTimeRefresh', False)
                     )
                     
                     Logger.info("Settings fetched successfully")
@@ -644,7 +907,8 @@ class EventSettings:
     
     def __init__(self, important_date, start_from_day, primary_color, secondary_color,
                  use_custom_colors, start_time, end_time, from_pi, is_reverse, 
-                 with_marker, marker_color, is_flashing=True, flash_speed=2, auto_update=True, update_branch='main'):
+                 with_marker, marker_color, is_flashing=True, flash_speed=2, auto_update=True, update_branch='main',
+                 force_time_refresh=False):
         self.important_date = important_date
         self.start_from_day = start_from_day
         self.primary_color = primary_color
@@ -660,7 +924,24 @@ class EventSettings:
         self.flash_speed = flash_speed
         self.auto_update = auto_update
         self.update_branch = update_branch
-    
+        self.force_time_refresh = force_time_refresh
+        # Parsing the date string and running mktime are expensive on
+        # MicroPython, so cache the target epoch once per settings fetch
+        self.important_date_epoch = time.mktime(
+            DateUtils.string_to_datetime_tuple(important_date))
+        # Likewise parse the daily time range once; the main loop checks
+        # it every iteration
+        start_hour, start_minute = map(int, start_time.split(':'))
+        end_hour, end_minute = map(int, end_time.split(':'))
+        self.start_minutes = start_hour * 60 + start_minute
+        self.end_minutes = end_hour * 60 + end_minute
+        # Parse the '(R,G,B)' strings once so the animation loop never
+        # touches string parsing (colors may be absent when custom
+        # colors are disabled)
+        self.primary_rgb = ColorUtils.string_to_rgb(primary_color) if primary_color else None
+        self.secondary_rgb = ColorUtils.string_to_rgb(secondary_color) if secondary_color else None
+        self.marker_rgb = ColorUtils.string_to_rgb(marker_color) if marker_color else None
+
     def log_settings(self):
         """Log all settings."""
         Logger.info(f"Important Date: {self.important_date}")
@@ -701,33 +982,52 @@ class CountdownState:
         self.animation_phase = 0
         # Swap colors phase control
         self.swap_phase = False
+        self.refresh_from_settings()
         try:
             self._last_swap_ms = time.ticks_ms()
         except Exception:
             self._last_swap_ms = 0
         Logger.info("CountdownState: Initialization complete")
+
+    def refresh_from_settings(self):
+        """Recompute cached settings-derived values after a settings refresh."""
+        # Cached so update_flash_phase avoids a soft-float multiply and
+        # int() per animation tick
+        interval_ms = int(self.settings.flash_speed * 1000)
+        self._interval_ms = interval_ms if interval_ms > 0 else 2000
+
+    def update(self, current_date, settings):
+        """Re-point the state at a new date and settings in place."""
+        self.current_date = current_date
+        self.settings = settings
+        self.days_remaining = self._calculate_days_remaining()
+        Logger.info(f"Days remaining: {self.days_remaining}")
+        self.countdown_length = self._calculate_countdown_length()
+        self.base_color = ColorUtils.random_base_color()
+        self.refresh_from_settings()
     
     def _calculate_days_remaining(self):
         """Calculate days until the important date."""
-        return DateUtils.days_between(self.current_date, self.settings.important_date)
-    
+        return DateUtils.days_between_epoch(
+            self.current_date, self.settings.important_date_epoch)
+
     def _calculate_countdown_length(self):
         """Calculate total countdown length in days."""
         start_date = DateUtils.string_to_date_tuple(self.settings.start_from_day)
-        return abs(DateUtils.days_between(start_date, self.settings.important_date))
+        return abs(DateUtils.days_between_epoch(
+            start_date, self.settings.important_date_epoch))
     
+    @micropython.native
     def update_animation_phase(self):
-        """Update the animation phase for smooth effects."""
-        self.animation_phase = (self.animation_phase + ANIMATION_SPEED) % (2 * math.pi)
+        """Advance the fixed-point animation phase for smooth effects."""
+        self.animation_phase = (self.animation_phase + PHASE_STEP) & PHASE_MASK
     
+    @micropython.native
     def update_flash_phase(self):
         """Toggle primary/secondary swap every flash_speed seconds."""
         try:
             now = time.ticks_ms()
-            interval_ms = int(self.settings.flash_speed * 1000)
-            if interval_ms <= 0:
-                interval_ms = 2000
-            if time.ticks_diff(now, self._last_swap_ms) >= interval_ms:
+            if time.ticks_diff(now, self._last_swap_ms) >= self._interval_ms:
                 self.swap_phase = not self.swap_phase
                 self._last_swap_ms = now
         except Exception:
@@ -746,126 +1046,245 @@ class AnimationEngine:
     def __init__(self, led_controller, countdown_state):
         self.led = led_controller
         self.state = countdown_state
+        # Squared distance of each pixel from the strip centre, used by
+        # the breathing Gaussian; computed once instead of per frame
+        half = led_controller.num_pixels / 2
+        self._half_sq = tuple((half - i) ** 2 for i in range(led_controller.num_pixels))
+        # (block_min, block_max) per day_index; rebuilt only when the
+        # countdown length or direction changes
+        self._block_ranges = None
+        self._block_ranges_key = None
+        # Marker block-start positions, cached with the same key
+        self._marker_positions = ()
+        # Key of the last frame actually drawn; see render()
+        self._last_key = None
+
+    def _day_ranges(self, countdown_length, from_pi):
+        """Return cached per-day pixel ranges for the current layout."""
+        key = (countdown_length, from_pi)
+        if key != self._block_ranges_key:
+            num_pixels = self.led.num_pixels
+            block_size = num_pixels // countdown_length
+            ranges = []
+            for day_index in range(countdown_length + 1):
+                if not from_pi:
+                    block_max = num_pixels - (countdown_length - day_index) * block_size
+                    block_min = block_max - block_size if day_index > 1 else 0
+                else:
+                    block_min = (countdown_length - day_index) * block_size
+                    block_max = block_min + block_size if day_index > 1 else num_pixels
+                ranges.append((block_min, block_max))
+            self._block_ranges = tuple(ranges)
+            self._marker_positions = tuple(
+                (num_pixels - (block + 1) * block_size) if not from_pi
+                else block * block_size
+                for block in range(countdown_length)
+            )
+            self._block_ranges_key = key
+        return self._block_ranges
     
     def render(self):
         """Render the current countdown state to the LED strip."""
-        if self.state.days_remaining <= self.state.countdown_length:
+        state = self.state
+        # The renders quantize the phase to its top byte, so two calls
+        # inside the same byte of phase (and identical display inputs)
+        # produce the same frame - skip the redraw and the write
+        key = (state.animation_phase >> 8, state.days_remaining,
+               state.swap_phase, state.settings.is_flashing)
+        if key == self._last_key:
+            return
+        self._last_key = key
+
+        if state.days_remaining <= state.countdown_length:
             self._render_countdown()
         else:
             self._render_breathing()
-        
+
         self.led.write()
     
     def _render_countdown(self):
         """Render countdown blocks."""
-        settings = self.state.settings
-        days_remaining = self.state.days_remaining
-        countdown_length = self.state.countdown_length
-        phase = self.state.animation_phase
-        # Alternate flashing group: 0 = primary blocks, 1 = secondary blocks
-        flashing_group = 0 if math.sin(phase) >= 0 else 1
+        state = self.state
+        led = self.led
+        settings = state.settings
+        days_remaining = state.days_remaining
+        countdown_length = state.countdown_length
+        phase = state.animation_phase
+        sin_phase = SINE_LUT[(phase >> 8) & 0xFF]
+        # Alternate flashing group: 0 = primary blocks, 1 = secondary
+        # blocks. The sign of the sine follows directly from the phase
+        # integer (first half of the cycle is the positive half-wave),
+        # so no float compare is needed
+        flashing_group = 0 if phase < 0x8000 else 1
         # Gentle pulse factor for active group (gives a Christmas vibe)
         # Use an eased pulse for smoother visual effect
-        raw = (math.sin(phase) + 1) / 2  # 0..1
+        raw = (sin_phase + 1) * 0.5  # 0..1
         pulse = raw * raw * (3 - 2 * raw)  # smoothstep ease-in-out
         # Increase brightness difference to make flashing more noticeable (up to +35%)
-        lighten_factor = 1.0 + 0.35 * pulse
-        
-        # Determine which days to show
+        # Quantize the pulse to a LIGHTEN_LUT bucket for this frame
+        lighten_base = int(pulse * (LIGHTEN_BUCKETS - 1) + 0.5) << 8
+        lighten_lut = LIGHTEN_LUT
+
+        # Hoist everything constant for this frame out of the pixel
+        # loops - attribute access is a dict lookup per reference on
+        # MicroPython
+        use_custom = settings.use_custom_colors
+        is_flashing = settings.is_flashing
+        swap_phase = state.swap_phase
+        from_pi = settings.from_pi
+        num_pixels = led.num_pixels
+        set_pixel = led._set
+        fill_range = led.fill_range
+        getrandbits = random.getrandbits
+        shadow = led.shadow
+        order = led._order
+        o_r = order[0]
+        o_g = order[1]
+        o_b = order[2]
+        marker_rgb = settings.marker_rgb
+
+        swap = 1 if swap_phase else 0
+        # Flash state by parity index: 0 = primary blocks, 1 = secondary
+        flash_for_idx = (is_flashing and flashing_group == 0,
+                         is_flashing and flashing_group == 1)
+        if use_custom:
+            prim = settings.primary_rgb
+            sec = settings.secondary_rgb
+            if flash_for_idx[0]:
+                prim = (lighten_lut[lighten_base + prim[0]],
+                        lighten_lut[lighten_base + prim[1]],
+                        lighten_lut[lighten_base + prim[2]])
+            if flash_for_idx[1]:
+                sec = (lighten_lut[lighten_base + sec[0]],
+                       lighten_lut[lighten_base + sec[1]],
+                       lighten_lut[lighten_base + sec[2]])
+            # Final per-parity colors with the flash already applied
+            block_color = (prim, sec)
+
+        # Determine which days to show. Once the event has passed,
+        # days_remaining goes negative; stop the range at day 0 so
+        # negative indices never reach the cached range table (Python
+        # would wrap them to the top of the strip)
         if not settings.is_reverse:
-            day_range = range(countdown_length, days_remaining - 1, -1)
+            day_range = range(countdown_length, max(days_remaining - 1, -1), -1)
         else:
             day_range = range(days_remaining - 1, -1, -1)
-        
-        # Calculate block size
-        block_size = self.led.num_pixels // countdown_length
-        
+
+        day_ranges = self._day_ranges(countdown_length, from_pi)
+
+        block_min = block_max = -1
         for day_index in day_range:
-            # Calculate pixel range for this day block
-            if not settings.from_pi:
-                # Start from end of strip
-                block_max = self.led.num_pixels - (countdown_length - day_index) * block_size
-                if day_index > 1:
-                    block_min = block_max - block_size
-                else:
-                    block_min = 0
-            else:
-                # Start from beginning of strip
-                block_min = (countdown_length - day_index) * block_size
-                if day_index > 1:
-                    block_max = block_min + block_size
-                else:
-                    block_max = self.led.num_pixels
-            
+            # Parity index of this block (0 = primary, 1 = secondary)
+            # with the swap phase folded in as an XOR
+            idx = (day_index & 1) ^ swap
+
+            # Pixel range for this day block
+            block_min, block_max = day_ranges[day_index]
+
             # Fill block with color
-            for pixel in range(block_min, block_max):
-                if settings.use_custom_colors:
-                    is_primary_block = (day_index % 2 == 0)
-                    # Apply swap phase: invert mapping when swap_phase is True
-                    if self.state.swap_phase:
-                        is_primary_block = not is_primary_block
-                    if is_primary_block:
-                        color = ColorUtils.string_to_rgb(settings.primary_color)
-                    else:
-                        color = ColorUtils.string_to_rgb(settings.secondary_color)
-                    # Apply flashing alternance
-                    if settings.is_flashing:
-                        if (flashing_group == 0 and is_primary_block) or (flashing_group == 1 and not is_primary_block):
-                            color = ColorUtils.lighten(color, lighten_factor)
-                else:
-                    # Animated color variation
-                    variation_1 = ((countdown_length + 1) - day_index) * random.choice([-1, 1])
-                    variation_2 = ((countdown_length + 1) - day_index) * random.choice([-1, 1])
-                    r, g, b = self.led.get_pixel(pixel)
-                    r = ColorUtils.clamp(r + variation_1)
-                    g = ColorUtils.clamp(g - variation_1)
-                    b = ColorUtils.clamp(b + variation_2)
-                    color = (r, g, b)
+            if use_custom:
+                # The color is constant across the block - one table
+                # lookup and one C-level slice write per day
+                fill_range(block_min, block_max, block_color[idx])
+            else:
+                flash_active = flash_for_idx[idx]
+                magnitude = (countdown_length + 1) - day_index
+                # Draw random signs two bits at a time from a 32-bit
+                # pool: random.choice([-1, 1]) allocates a list and
+                # dispatches per call, twice per pixel
+                rand_bits = getrandbits(32)
+                bits_left = 32
+                for pixel in range(block_min, block_max):
+                    if bits_left < 2:
+                        rand_bits = getrandbits(32)
+                        bits_left = 32
+                    # Animated color variation, applied straight to the
+                    # staging buffer bytes - no tuples per pixel
+                    variation_1 = magnitude * (((rand_bits & 1) << 1) - 1)
+                    variation_2 = magnitude * ((rand_bits & 2) - 1)
+                    rand_bits >>= 2
+                    bits_left -= 2
+                    offset = pixel * 3
+                    r = shadow[offset + o_r] + variation_1
+                    g = shadow[offset + o_g] - variation_1
+                    b = shadow[offset + o_b] + variation_2
+                    if r < 0:
+                        r = 0
+                    elif r > 255:
+                        r = 255
+                    if g < 0:
+                        g = 0
+                    elif g > 255:
+                        g = 255
+                    if b < 0:
+                        b = 0
+                    elif b > 255:
+                        b = 255
                     # Even without custom colors, gently flash blocks by parity
-                    if self.state.is_flashing:
-                        is_primary_block = (day_index % 2 == 0)
-                        # Apply swap phase: invert mapping when swap_phase is True
-                        if self.state.swap_phase:
-                            is_primary_block = not is_primary_block
-                        if (flashing_group == 0 and is_primary_block) or (flashing_group == 1 and not is_primary_block):
-                            color = ColorUtils.lighten(color, lighten_factor)
-                
-                self.led.set_pixel(pixel, color)
-            
-            # Add marker LEDs if enabled
-            if settings.with_marker:
-                for block in range(countdown_length):
-                    if not settings.from_pi:
-                        block_start = self.led.num_pixels - (block + 1) * block_size
-                    else:
-                        block_start = block * block_size
-                    
-                    # Only mark inactive blocks
-                    if block_start < block_min or block_start >= block_max:
-                        marker_rgb = ColorUtils.string_to_rgb(settings.marker_color)
-                        self.led.set_pixel(block_start, marker_rgb)
+                    if flash_active:
+                        r = lighten_lut[lighten_base + r]
+                        g = lighten_lut[lighten_base + g]
+                        b = lighten_lut[lighten_base + b]
+                    shadow[offset + o_r] = r
+                    shadow[offset + o_g] = g
+                    shadow[offset + o_b] = b
+
+        # Add marker LEDs if enabled: one pass over the cached start
+        # positions, skipping those inside the last-drawn block (whose
+        # fill is the one that historically overwrote earlier markers)
+        if settings.with_marker and block_max >= 0:
+            for block_start in self._marker_positions:
+                if block_start < block_min or block_start >= block_max:
+                    set_pixel(block_start, marker_rgb)
     
     def _render_breathing(self):
         """Render breathing animation when event arrives."""
-        settings = self.state.settings
-        base_r, base_g, base_b = self.state.base_color
-        phase = self.state.animation_phase
-        
-        for i in range(self.led.num_pixels):
-            pixel_index = self.led.num_pixels - 1 - i if settings.from_pi else i
-            
-            # Calculate breathing brightness
-            brightness = 32 * (1 + 4 * (math.sin(phase + math.pi) + 1)) * \
-                        math.exp(-(self.led.num_pixels / 2 - i) ** 2 / \
-                        (1 + 20 * (math.sin(phase) + 1)) ** 2)
-            
-            color = (
-                ColorUtils.clamp(base_r * brightness),
-                ColorUtils.clamp(base_g * brightness),
-                ColorUtils.clamp(base_b * brightness)
-            )
-            
-            self.led.set_pixel(pixel_index, color)
+        state = self.state
+        settings = state.settings
+        base_r, base_g, base_b = state.base_color
+        phase = state.animation_phase
+        sin_phase = SINE_LUT[(phase >> 8) & 0xFF]
+
+        # Everything except the Gaussian itself is constant per frame:
+        # hoist the amplitude, the 1/denom^2 factor and the 1/256 base
+        # scale into a single multiplier (sin(x + pi) == -sin(x))
+        num_pixels = self.led.num_pixels
+        half_sq = self._half_sq
+        shadow = self.led.shadow
+        order = self.led._order
+        o_r = order[0]
+        o_g = order[1]
+        o_b = order[2]
+        exp_lut = EXP_LUT
+        from_pi = settings.from_pi
+        amp_scale = 32 * (1 + 4 * (-sin_phase + 1)) * 0.00390625
+        # Fold the table's 32-samples-per-unit step into the factor
+        inv_denom_sq = 32.0 / (1 + 20 * (sin_phase + 1)) ** 2
+
+        # Resolve the direction once: walk the staging buffer backwards
+        # for from_pi instead of mirroring the index on every pixel
+        offset = (num_pixels - 1) * 3 if from_pi else 0
+        step = -3 if from_pi else 3
+
+        for i in range(num_pixels):
+            # exp(-t) via the table; entries past the range are black
+            t_idx = int(half_sq[i] * inv_denom_sq)
+            scale = amp_scale * exp_lut[t_idx] if t_idx < 256 else 0.0
+            # Channels and scale are non-negative and scale tops out at
+            # 1.125, so only the upper clamp can ever trigger
+            r = int(base_r * scale)
+            g = int(base_g * scale)
+            b = int(base_b * scale)
+            if r > 255:
+                r = 255
+            if g > 255:
+                g = 255
+            if b > 255:
+                b = 255
+            shadow[offset + o_r] = r
+            shadow[offset + o_g] = g
+            shadow[offset + o_b] = b
+            offset += step
 
 
 # ============================================================================
@@ -891,6 +1310,14 @@ class CountdownApplication:
         self.timezone_offset = None
         self.animation_engine = None
         self.iteration_count = 0
+        # Per-second cache for the clock/time-range work in the main
+        # loop, which ticks far faster than the wall clock
+        self._last_second = -1
+        self._cached_adjusted = None
+        self._cached_in_range = False
+        # What the strip is currently showing ("off" or "anim"), so off
+        # periods don't re-clear an already dark strip every tick
+        self._strip_state = "off"
     
     def startup(self):
         """Perform startup sequence."""
@@ -922,19 +1349,30 @@ class CountdownApplication:
         else:
             Logger.info("Auto-update disabled, skipping update check")
         
-        # Step 3: Get timezone
+        # Step 3: Get timezone - reuse the cached value when it's fresh;
+        # each skipped HTTPS call saves a DNS lookup plus TLS handshake
+        # at boot
         self.led_controller.show_progress(3)
-        self.timezone = TimeAPI.get_timezone()
-        if not self.timezone:
-            self._error_state("Failed to get timezone", COLOR_ERROR_TIMEZONE)
-            return False
-        
-        # Step 4: Get timezone offset
-        self.led_controller.show_progress(4)
-        self.timezone_offset = TimeAPI.get_timezone_offset(self.timezone)
-        if self.timezone_offset is None:
-            self._error_state("Failed to get timezone offset", COLOR_ERROR_TIMEZONE_OFFSET)
-            return False
+        force_refresh = bool(temp_settings and temp_settings.force_time_refresh)
+        cached = None if force_refresh else TimeAPI.load_cached_timezone()
+        if cached:
+            self.timezone, self.timezone_offset = cached
+            Logger.info(f"Using cached timezone: {self.timezone} (offset {self.timezone_offset}h)")
+            self.led_controller.show_progress(4)
+        else:
+            self.timezone = TimeAPI.get_timezone()
+            if not self.timezone:
+                self._error_state("Failed to get timezone", COLOR_ERROR_TIMEZONE)
+                return False
+
+            # Step 4: Get timezone offset
+            self.led_controller.show_progress(4)
+            self.timezone_offset = TimeAPI.get_timezone_offset(self.timezone)
+            if self.timezone_offset is None:
+                self._error_state("Failed to get timezone offset", COLOR_ERROR_TIMEZONE_OFFSET)
+                return False
+
+            TimeAPI.save_cached_timezone(self.timezone, self.timezone_offset)
         
         # Step 5: Get local date
         self.led_controller.show_progress(5)
@@ -996,33 +1434,45 @@ class CountdownApplication:
         # Read light sensor
         is_dark, consistent_dark, consistent_light = self.light_sensor.update()
         
-        # Get current time
-        current_time = time.localtime()
-        adjusted_time = DateUtils.adjust_time_with_offset(current_time, self.timezone_offset)
-        
-        # Log periodically
-        if self.iteration_count % SETTINGS_REFRESH_ITERATIONS == 0:
+        # Get current time; the offset adjustment and range check only
+        # change when the wall-clock second does, so recompute at most
+        # once per second instead of every tick
+        now = time.time()
+        if now != self._last_second:
+            self._last_second = now
+            self._cached_adjusted = DateUtils.adjust_time_with_offset(
+                time.localtime(), self.timezone_offset)
+            settings = self.countdown_state.settings
+            self._cached_in_range = DateUtils.is_within_time_range_precomputed(
+                settings.start_minutes,
+                settings.end_minutes,
+                self._cached_adjusted
+            )
+        adjusted_time = self._cached_adjusted
+        in_time_range = self._cached_in_range
+
+        # Log periodically; evaluate the gate once and build the
+        # f-strings only on ticks that actually log
+        log_tick = self.iteration_count % SETTINGS_REFRESH_ITERATIONS == 0
+        if log_tick:
             Logger.info(f"Current time: {adjusted_time[3]:02d}:{adjusted_time[4]:02d}")
         
-        # Check if we should display lights
-        in_time_range = DateUtils.is_within_time_range(
-            self.countdown_state.settings.start_time,
-            self.countdown_state.settings.end_time,
-            adjusted_time
-        )
-        
         if in_time_range:
-            if self.iteration_count % SETTINGS_REFRESH_ITERATIONS == 0:
+            if log_tick:
                 Logger.info("-> Lights ON (in time range)")
             
             if consistent_dark:
                 self.animation_engine.render()
-            elif consistent_light:
+                self._strip_state = "anim"
+            elif consistent_light and self._strip_state != "off":
                 self.led_controller.clear()
+                self._strip_state = "off"
         else:
-            if self.iteration_count % SETTINGS_REFRESH_ITERATIONS == 0:
+            if log_tick:
                 Logger.info("-> Lights OFF (outside time range)")
-            self.led_controller.clear()
+            if self._strip_state != "off":
+                self.led_controller.clear()
+                self._strip_state = "off"
         
         # Check if we should refresh settings (new day detected)
         if consistent_light and in_time_range:
@@ -1045,9 +1495,12 @@ class CountdownApplication:
             Logger.error("Failed to refresh settings")
             return
         
-        # Update state
-        self.countdown_state = CountdownState(current_date, settings)
-        self.animation_engine = AnimationEngine(self.led_controller, self.countdown_state)
+        # Update state in place: rebuilding CountdownState and
+        # AnimationEngine would discard the engine's precomputed tables
+        # and churn the heap for nothing
+        self.countdown_state.update(current_date, settings)
+        # New settings can change the display window; drop the cache
+        self._last_second = -1
         
         Logger.info("Settings refreshed successfully")
     
@@ -1078,6 +1531,7 @@ def main():
         app.run()
     else:
         Logger.error("Startup failed - halting")
+        Logger.flush()
         while True:
             time.sleep(60)
 
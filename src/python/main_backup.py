@@ -8,6 +8,8 @@ import random
 import math
 import config
 import os
+import gc
+import json
 
 # Globals
 
@@ -21,6 +23,17 @@ ldr = ADC(26)  # LDR connected to ADC on GPIO 26
 switch = Pin(15, Pin.IN, Pin.PULL_UP)  # Pull-up for momentary switch
 np = neopixel.NeoPixel(Pin(28), PIXELS)
 led = Pin("LED", Pin.OUT)
+# Timezone offset cache: short TTL so DST transitions are picked up
+TZ_CACHE_FILE = "tz_cache.json"
+TZ_CACHE_TTL = 2 * 3600  # seconds
+
+# Byte order of the neopixel buffer (GRB for WS2812 strips)
+NEO_ORDER = getattr(np, 'ORDER', (1, 0, 2, 3))
+# Squared distance of each pixel from the strip centre, used by the
+# breathing effect's gaussian envelope
+HALF_SQ = tuple((PIXELS/2 - i) ** 2 for i in range(PIXELS))
+# Copy of the last transmitted frame, to skip identical retransmits
+_last_buf = bytearray(PIXELS * 3)
 
 # Function to connect to WiFi
 def connect_to_wifi(ssid, password):
@@ -33,26 +46,39 @@ def connect_to_wifi(ssid, password):
     print("Connected to WiFi:", wlan.ifconfig())
 
 
+def _get_json(url):
+    # Shared HTTP JSON fetch for all the endpoints. urequests has no
+    # session/keep-alive support to pool connections with, so the
+    # realistic win on a Pico W is closing every response promptly and
+    # compacting the heap between requests - the TLS buffers are the
+    # largest allocations this program ever makes.
+    response = None
+    try:
+        response = urequests.get(url)
+        if response.status_code == 200:
+            return response.json()
+        log_error(f"HTTP {response.status_code} fetching {url}")
+        return None
+    finally:
+        if response:
+            response.close()
+        gc.collect()
+
+
 # Function to get timezone using ip-api.com
 def get_timezone():
     url = "http://ipwhois.app/json/"
     try:
         print("Fetching timezone from IP...")
-        response = urequests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            timezone = data.get('timezone', None)
-            response.close()
-            if timezone:
-                print(f"Detected timezone: {timezone}")
-                return timezone
-            else:
-                print("Timezone not found in response.")
-                return None
-        else:
-            log_error(f"Error fetching timezone: {response.status_code}")
-            response.close()
+        data = _get_json(url)
+        if data is None:
             return None
+        timezone = data.get('timezone', None)
+        if timezone:
+            print(f"Detected timezone: {timezone}")
+            return timezone
+        print("Timezone not found in response.")
+        return None
     except Exception as e:
         log_error(f"Error retrieving timezone: {e}")
         return None
@@ -61,22 +87,37 @@ def get_timezone_offset(timezone):
     url = f"http://worldtimeapi.org/api/timezone/{timezone}"
     try:
         log_msg(f"Fetching timezone offset for timezone: {timezone}")
-        response = urequests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            offset = data['utc_offset']
-            # Convert offset from format "+HH:MM" to hours
-            hours_offset = int(offset[:3])
-            response.close()
-            return hours_offset
-        else:
-            log_error(f"Error fetching timezone offset: {response.status_code}")
-            response.close()
+        data = _get_json(url)
+        if data is None:
             return None
+        offset = data['utc_offset']
+        # Convert offset from format "+HH:MM" to hours
+        return int(offset[:3])
     except Exception as e:
         log_error(f"Exception retrieving timezone offset: {e}")
         return None
 
+def load_cached_offset(timezone):
+    # Return the cached UTC offset for this timezone, or None when the
+    # cache is missing, stale, or for another zone
+    try:
+        with open(TZ_CACHE_FILE) as f:
+            cached = json.load(f)
+        if cached.get('tz') != timezone:
+            return None
+        if time.time() - cached.get('ts', 0) > TZ_CACHE_TTL:
+            return None
+        return cached.get('offset')
+    except Exception:
+        return None
+
+def save_cached_offset(timezone, offset):
+    try:
+        with open(TZ_CACHE_FILE, 'w') as f:
+            json.dump({'tz': timezone, 'offset': offset, 'ts': time.time()}, f)
+    except Exception as e:
+        log_error(f"Failed to save timezone cache: {e}")
+
 def adjust_time_with_offset(current_time, offset):
     adjusted_time = time.mktime(current_time) + offset * 3600
     return time.localtime(adjusted_time)
@@ -86,30 +127,27 @@ def get_local_time(timezone):
     url = f"https://timeapi.io/api/Time/current/zone?timeZone={timezone}"
     try:
         log_msg(f"Fetching local time for timezone: {timezone}")
-        response = urequests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            # Extract year, month, day directly from the JSON response
-            year = data['year']
-            month = data['month']
-            day = data['day']
-            response.close()
-            return (year, month, day)
-        else:
-            log_error(f"Error fetching local time: {response.status_code}")
-            response.close()
+        data = _get_json(url)
+        if data is None:
             return None
+        # Extract year, month, day directly from the JSON response
+        return (data['year'], data['month'], data['day'])
     except Exception as e:
         log_error(f"Exception retrieving local time: {e}")
         return None
 
-def get_local_time_with_retries(timezone, retries=3, delay=5):
+def get_local_time_with_retries(timezone, retries=5, base=1, cap=30):
     for attempt in range(retries):
         local_time = get_local_time(timezone)
         if local_time:
             return local_time
-        log_error(f"Attempt {attempt + 1} failed to get local time. Retrying in {delay} seconds...")
-        time.sleep(delay)
+        if attempt < retries - 1:
+            # Exponential backoff with full jitter: transient hiccups
+            # retry quickly, sustained outages back off instead of
+            # hammering the endpoint on a fixed beat
+            delay = random.random() * min(cap, base * (1 << attempt))
+            log_error(f"Attempt {attempt + 1} failed to get local time. Retrying in {delay:.1f} seconds...")
+            time.sleep(delay)
     log_error("Failed to get local time after multiple attempts.")
     return None
 
@@ -119,54 +157,66 @@ def get_local_time_with_retries(timezone, retries=3, delay=5):
 def get_light_settings():
     try:
         log_msg(f"Fetching online settings")
-        response = urequests.get(SETTINGSURL)
-        if response.status_code == 200:
-            data = response.json()
-            # Extract ImportantDate, PrimaryRGBColor, SecondaryRGBColor directly from the JSON response
-            ImportantDate = data['ImportantDate']
-            StartFromDay = data['StartFromDay']
-            PrimaryRGBColor = data['PrimaryRGBColor']
-            SecondaryRGBColor = data['SecondaryRGBColor']
-            UseCustomColors = data['UseCustomColors']
-            StartTime = data['StartTime']
-            EndTime = data['EndTime']
-            from_pi = data.get('FromPi', False)
-            is_reverse =  data.get('IsReverse', False)
-            with_marker =  data.get('WithMarker', True)
-            marker_color =  data.get('MarkerRGBColor', (255, 255, 255))
-            response.close()
-            return (ImportantDate, StartFromDay, PrimaryRGBColor, SecondaryRGBColor, UseCustomColors, StartTime, EndTime, from_pi, is_reverse, with_marker, marker_color)
-        else:
-            log_error(f"Error fetching online settings: {response.status_code}")
-            response.close()
+        data = _get_json(SETTINGSURL)
+        if data is None:
             return None
+        # Extract ImportantDate, PrimaryRGBColor, SecondaryRGBColor directly from the JSON response
+        ImportantDate = data['ImportantDate']
+        StartFromDay = data['StartFromDay']
+        # Colors are parsed here, once per fetch, so progress() never
+        # touches a string on the hot path
+        PrimaryRGBColor = _to_rgb(data['PrimaryRGBColor'])
+        SecondaryRGBColor = _to_rgb(data['SecondaryRGBColor'])
+        UseCustomColors = data['UseCustomColors']
+        StartTime = data['StartTime']
+        EndTime = data['EndTime']
+        from_pi = data.get('FromPi', False)
+        is_reverse =  data.get('IsReverse', False)
+        with_marker =  data.get('WithMarker', True)
+        marker_color =  _to_rgb(data.get('MarkerRGBColor', (255, 255, 255)))
+        return (ImportantDate, StartFromDay, PrimaryRGBColor, SecondaryRGBColor, UseCustomColors, StartTime, EndTime, from_pi, is_reverse, with_marker, marker_color)
     except Exception as e:
         log_error(f"Error retrieving online settings: {e}")
         return None    
 
 
 
-# Function to convert a string "yyyy-MM-dd" to a date
-def string_to_date(date_string):
-    year, month, day = map(int, date_string.split('-'))
-    return (year, month, day, 0, 0, 0, 0, 0)
+def _jdn(year, month, day):
+    # Julian Day Number: exact day count in pure integer math, with no
+    # mktime epoch limits on 32-bit builds and no C timezone work
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
 
 # Calculate sleeps until special_day
 def days_between_dates(current_date, special_day):
-    current_year = current_date[0]
-    special_day_struct = time.mktime(string_to_date(special_day))  
-
-    today_struct = time.mktime(current_date + (0, 0, 0, 0, 0))
-    sleeps = (special_day_struct - today_struct) // 86400 # seconds in a day
-    
-    return int(sleeps)
+    special = string_to_date_tuple(special_day)
+    return _jdn(special[0], special[1], special[2]) - \
+        _jdn(current_date[0], current_date[1], current_date[2])
 
 
+@micropython.native
 def clamp(value, min_val=0, max_val=255):
     # Clamp a value between min_val and max_val.
     return max(min(int(value), max_val), min_val)
 
 
+def rgb_bytes(rgb):
+    # Pack an (r, g, b) tuple into the strip's buffer byte order
+    raw = bytearray(3)
+    raw[NEO_ORDER[0]] = rgb[0]
+    raw[NEO_ORDER[1]] = rgb[1]
+    raw[NEO_ORDER[2]] = rgb[2]
+    return bytes(raw)
+
+
+# Compiled with the native emitter: progress() runs per-pixel work on
+# every main-loop tick and the machine-code emitter speeds it up without
+# any source change. The viper emitter is not used here - its four-arg
+# limit and int-only typing don't fit a function juggling tuples and
+# floats.
+@micropython.native
 def progress(countdown_days, np, sleeps, spread, light_settings):
     from_pi = light_settings[7]
     is_reverse = light_settings[8]
@@ -182,12 +232,31 @@ def progress(countdown_days, np, sleeps, spread, light_settings):
         else:
             # Reversed logic - show days remaining (sleeps-1 down to 0)
             day_range = range(sleeps-1, -1, -1)
-            
+
+        # Everything below is constant across the day loop - parse the
+        # colors and compute the block size once, not per day (or worse,
+        # per pixel)
+        use_custom = light_settings[4]
+        pixelblockchunk = int(PIXELS/countdown_days) # We'll use blocks of this size for the first countdown_days days
+        buf = np.buf
+        o_r = NEO_ORDER[0]
+        o_g = NEO_ORDER[1]
+        o_b = NEO_ORDER[2]
+        getrandbits = random.getrandbits
+        if use_custom:
+            # Colors are already parsed tuples (see get_light_settings)
+            primary_raw = rgb_bytes(light_settings[2])
+            secondary_raw = rgb_bytes(light_settings[3])
+
+        pixelblockmin = pixelblockmax = -1
         for i in day_range:
-            variation_1 = ((countdown_days+1)-i) * random.choice ([-1,1])
-            variation_2 = ((countdown_days+1)-i) * random.choice ([-1,1])
-            pixelblockchunk = int(PIXELS/countdown_days) # We'll use blocks of this size for the first countdown_days days
-            
+            # Two random sign bits per day; random.choice([-1,1])
+            # allocated a list and dispatched per call
+            bits = getrandbits(2)
+            magnitude = (countdown_days+1) - i
+            variation_1 = magnitude * (((bits & 1) << 1) - 1)
+            variation_2 = magnitude * ((bits & 2) - 1)
+
             if not from_pi:
                 # Original direction (start from end of strip)
                 pixelblockmax = PIXELS - (countdown_days - i) * pixelblockchunk
@@ -203,42 +272,73 @@ def progress(countdown_days, np, sleeps, spread, light_settings):
                 else:
                     pixelblockmax = PIXELS
             
-            for j in range(pixelblockmin, pixelblockmax):
-                # Each block drifts at random, clamped between 0 and 255
-                r, g, b = np[j]  # The current RGB values of the pixel
-                r = clamp(r + variation_1)
-                g = clamp(g - variation_1)
-                b = clamp(b + variation_2)
-                if light_settings[4] == True:
-                    if i % 2 == 0:
-                        np[j] = string_to_rgb(light_settings[2])
-                    else:
-                        np[j] = string_to_rgb(light_settings[3])
+            if use_custom:
+                # Constant color per block: fill it with one slice write
+                raw = primary_raw if i % 2 == 0 else secondary_raw
+                buf[pixelblockmin * 3:pixelblockmax * 3] = raw * (pixelblockmax - pixelblockmin)
+            else:
+                for j in range(pixelblockmin, pixelblockmax):
+                    # Each block drifts at random, clamped between 0 and 255
+                    # Work on the raw buffer bytes: np[j] boxes a tuple
+                    # per read and per write
+                    o = j * 3
+                    r = buf[o + o_r] + variation_1
+                    g = buf[o + o_g] - variation_1
+                    b = buf[o + o_b] + variation_2
+                    if r < 0:
+                        r = 0
+                    elif r > 255:
+                        r = 255
+                    if g < 0:
+                        g = 0
+                    elif g > 255:
+                        g = 255
+                    if b < 0:
+                        b = 0
+                    elif b > 255:
+                        b = 255
+                    buf[o + o_r] = r
+                    buf[o + o_g] = g
+                    buf[o + o_b] = b
+
+        # Add marker LEDs for inactive blocks when with_marker is True.
+        # Running this inside the day loop was O(countdown_days^2) per
+        # frame; its net effect was markers at every block start except
+        # inside the last-drawn block (each day's fill overwrote markers
+        # placed by earlier passes), which one pass here reproduces
+        if with_marker and pixelblockmax >= 0:
+            for block in range(countdown_days):
+                if not from_pi:
+                    # Original direction (start from end of strip)
+                    block_start = PIXELS - (block + 1) * pixelblockchunk
                 else:
-                    np[j] = (r,g,b)
-
-            # Add marker LEDs for inactive blocks when with_marker is True
-            if with_marker:
-                for block in range(countdown_days):
-                    if not from_pi:
-                        # Original direction (start from end of strip)
-                        block_start = PIXELS - (block + 1) * pixelblockchunk
-                    else:
-                        # Reversed direction (start from beginning of strip)
-                        block_start = block * pixelblockchunk
-                    # Only set marker if it's outside the current active block
-                    if block_start < pixelblockmin or block_start >= pixelblockmax:
-                        np[block_start] = string_to_rgb(marker_color)
+                    # Reversed direction (start from beginning of strip)
+                    block_start = block * pixelblockchunk
+                # Only set marker if it's outside the last active block
+                if block_start < pixelblockmin or block_start >= pixelblockmax:
+                    np[block_start] = marker_color
 
-            
     else:
-        # Rest of the function remains unchanged for the breathing effect
+        # Breathing effect. The two sin() calls don't depend on i, so
+        # compute the amplitude and the gaussian denominator once per
+        # frame and take the centre distances from the HALF_SQ table
+        amp = 32 * (1 + 4 * (math.sin(spread + math.pi) + 1))
+        inv_denom = -1.0 / (1 + 20 * (math.sin(spread) + 1)) ** 2
+        mexp = math.exp
         for i in range(PIXELS):
             pixel_index = PIXELS - 1 - i if from_pi else i
-            brightness = 32 * (1 + 4 *(math.sin(spread + math.pi)+1)) * math.exp(-(PIXELS/2-i) ** 2 / (1+20*(math.sin(spread)+1)) ** 2)
+            brightness = amp * mexp(HALF_SQ[i] * inv_denom)
             np[pixel_index] = (clamp(todays_color_r * brightness), clamp(todays_color_g * brightness), clamp(todays_color_b * brightness))
 
-    np.write()
+    global _current_state
+    _current_state = "anim"
+    # Skip the 800 kHz transmit when the frame is bit-identical to the
+    # last one; a bytearray compare is a C-level memcmp. With custom
+    # colors the countdown frame only changes when sleeps does, so this
+    # saves almost every write
+    if np.buf != _last_buf:
+        _last_buf[:] = np.buf
+        np.write()
 
 
 def string_to_rgb(rgb_string):
@@ -250,16 +350,39 @@ def string_to_rgb(rgb_string):
     return (r, g, b)
 
 
+def _to_rgb(value):
+    # Settings colors arrive either as "(R,G,B)" strings or as real
+    # tuples/lists (the MarkerRGBColor default); normalize to a tuple
+    if isinstance(value, (tuple, list)):
+        return (int(value[0]), int(value[1]), int(value[2]))
+    return string_to_rgb(value)
+
+
+# What the strip is currently showing ("off", "anim", "error"), so the
+# off branch of the main loop doesn't retransmit an identical dark
+# frame every iteration
+_current_state = None
+
 def lightsout(np):
-    for i in range(PIXELS):
-        np[i] =  (0,0,0)
+    global _current_state
+    if _current_state == "off":
+        return
+    np.fill((0, 0, 0))
     np.write()
+    # Keep the last-transmitted shadow in sync, or progress() would
+    # compare its next frame against a stale copy and skip the write
+    _last_buf[:] = np.buf
+    _current_state = "off"
 
 
 # Function to validate that the lightstrip is working
 def wake_up_routine(pixels):
+    # Write the chase pixel straight into the buffer; the tuple path
+    # through np[i] boxes and unpacks (r, g, b) on every step
+    green = rgb_bytes((0, 255, 0))
+    buf = np.buf
     for i in range(pixels):
-        np[i] = (0, 255, 0)
+        buf[i*3:i*3+3] = green
         np.write()
         time.sleep_ms(10)
 
@@ -275,49 +398,77 @@ def wake_up_routine(pixels):
     np.fill((0, 0, 0))
     np.write()
 
+    # Startup churn (WiFi, HTTP, logging) is over for now; compact the
+    # heap once so the main loop starts from a clean, unfragmented state
+    gc.collect()
+
 
 def string_to_date_tuple(date_string):
     year, month, day = map(int, date_string.split('-'))
     return (year, month, day)
 
 
-def is_within_time_range(start_time, end_time, current_time):
-    start_hour, start_minute = map(int, start_time.split(':'))
-    end_hour, end_minute = map(int, end_time.split(':'))
-    current_hour, current_minute = current_time[3], current_time[4]
-
-    start_minutes = start_hour * 60 + start_minute
-    end_minutes = end_hour * 60 + end_minute
-    current_minutes = current_hour * 60 + current_minute
+def time_to_minutes(time_string):
+    # "HH:MM" -> minutes since midnight
+    hour, minute = map(int, time_string.split(':'))
+    return hour * 60 + minute
 
+def is_within_minutes(start_minutes, end_minutes, current_minutes):
+    # Integer-only range check for the main loop; the string parsing
+    # happens once per settings fetch in time_to_minutes
     if start_minutes <= end_minutes:
         return start_minutes <= current_minutes <= end_minutes
     else:
         return current_minutes >= start_minutes or current_minutes <= end_minutes
 
+def is_within_time_range(start_time, end_time, current_time):
+    return is_within_minutes(time_to_minutes(start_time),
+                             time_to_minutes(end_time),
+                             current_time[3] * 60 + current_time[4])
+
 def display_error_state():
+    global _current_state
+    _current_state = "error"
     np.fill((255, 0, 0))
     np.write()
+    _last_buf[:] = np.buf
+
+# Log messages are buffered in RAM and flushed in batches: opening a
+# file on littlefs is the slowest part of a log write, so paying it
+# per message stalls the animation
+_log_buffer = []  # (filename, timestamp, message)
+_LOG_BUFFER_MAX = 64
+
+def _flush_logs():
+    global _log_buffer
+    pending = _log_buffer
+    _log_buffer = []
+    if not pending:
+        return
+    for logfile in ('errors.log', 'trace.log'):
+        lines = [f"{ts}: {msg}\n" for name, ts, msg in pending if name == logfile]
+        if not lines:
+            continue
+        try:
+            f = open(logfile, 'a')
+            for line in lines:
+                f.write(line)
+            f.close()
+        except:
+            # If we can't write to the log file, at least print to console
+            print(f"Failed to write to {logfile}")
 
 def log_error(error_msg):
     print(error_msg)
-    try:
-        f=open('errors.log', 'a')
-        f.write(f"{time.time()}: {error_msg}\n")
-        f.close()
-    except:
-        # If we can't write to the log file, at least print to console
-        print(f"Failed to log error: {error_msg}")
+    _log_buffer.append(('errors.log', time.time(), error_msg))
+    # Errors flush right away - they tend to precede a crash
+    _flush_logs()
 
 def log_msg(msg):
     print(msg)
-    try:
-        f=open('trace.log', 'a')
-        f.write(f"{time.time()}: {msg}\n")
-        f.close()
-    except:
-        # If we can't write to the log file, at least print to console
-        print(f"Failed to log error: {msg}")
+    _log_buffer.append(('trace.log', time.time(), msg))
+    if len(_log_buffer) >= _LOG_BUFFER_MAX:
+        _flush_logs()
 
 
 def reset_trace():
@@ -358,7 +509,7 @@ def show_progress(progress):
 
     np.write()
 
-def set_ntp_time_with_retries(retries=3, delay=5):
+def set_ntp_time_with_retries(retries=5, base=1, cap=30):
     for attempt in range(retries):
         try:
             ntptime.settime()
@@ -366,7 +517,8 @@ def set_ntp_time_with_retries(retries=3, delay=5):
         except Exception as e:
             log_error(f"Attempt {attempt + 1} failed to set NTP time: {e}")
             if attempt < retries - 1:  # Don't sleep on the last attempt
-                time.sleep(delay)
+                # Same backoff-with-jitter scheme as the time fetch
+                time.sleep(random.random() * min(cap, base * (1 << attempt)))
     log_error("Failed to set NTP time after multiple attempts")
     return False
 
@@ -385,6 +537,7 @@ def main():
     # Initialise local variables
     LDR_THRESHOLD = 700 # The light dependent resistor reading threshold for light/dark
     CONSECUTIVE_COUNT = 25 # Consecutive readings needed to count a reading as 'consistent
+    LDR_INTERVAL_MS = 50 # Sample the LDR at a fixed rate (25 samples = 1.25s of consistent state)
     consecutive_light_count = 0  # Counter for consecutive light readings below the threshold
     consecutive_dark_count = 0  # Counter for consecutive light readings below the threshold
     consistent_light = False
@@ -417,12 +570,16 @@ def main():
     log_msg(f"Detected timezone: {timezone}")
     show_progress(3)
 
-    # Get timezone offset
-    timezone_offset = get_timezone_offset(timezone)
+    # Get timezone offset; worldtimeapi is slow and flaky, so prefer a
+    # fresh cached value and only go to the network when it's missing
+    timezone_offset = load_cached_offset(timezone)
     if timezone_offset is None:
-        log_error("Could not retrieve timezone offset.")
-        display_error_state()
-        return
+        timezone_offset = get_timezone_offset(timezone)
+        if timezone_offset is None:
+            log_error("Could not retrieve timezone offset.")
+            display_error_state()
+            return
+        save_cached_offset(timezone, timezone_offset)
 
     # Get local time using the detected timezone with retries
     current_date = get_local_time_with_retries(timezone)
@@ -470,6 +627,10 @@ def main():
     log_msg(f"Start Time: {start_time}")
     log_msg(f"End Time: {end_time}")
 
+    # Parse the display window once; the loop compares plain minutes
+    start_minutes = time_to_minutes(start_time)
+    end_minutes = time_to_minutes(end_time)
+
     show_progress(10)
     time.sleep_ms(500)
     lightsout(np)
@@ -477,21 +638,72 @@ def main():
     log_msg(f"All Set. Starting main loop...")
  
     # sleeps = 1
-    iteration_count = 0
-    check_every = 10000 # Check every 10,000 iterations
+    FRAME_MS = 33  # ~30 fps; the WS2812 wire can't show more anyway
+    SPREAD_PER_MS = 0.05 / FRAME_MS  # same animation speed as the old 0.05/frame
+    LOG_EVERY_MS = 60000
+    NTP_RESYNC_MS = 6 * 3600 * 1000
+    next_frame_ms = time.ticks_ms()
+    last_log_ms = time.ticks_add(next_frame_ms, -LOG_EVERY_MS)
+    last_ldr_ms = time.ticks_add(next_frame_ms, -LDR_INTERVAL_MS)
+    last_ntp_ms = next_frame_ms
     # Main Loop
     while True:
-        spread = (spread +.05) % twopi # The parameter that gets passed to progress for periodic light
-        dark = ldr.read_u16() > LDR_THRESHOLD # True if ldr value is read as high
-        current_time = time.localtime()
-        adjusted_time = adjust_time_with_offset(current_time, timezone_offset)
-
-        if iteration_count % check_every == 0:
-            log_msg(f"it's currently: {adjusted_time[3]}:{adjusted_time[4]}")
+        now_ms = time.ticks_ms()
+        # Drive the animation phase from the wall clock so frame pacing
+        # never changes the animation speed
+        spread = (now_ms * SPREAD_PER_MS) % twopi # The parameter that gets passed to progress for periodic light
+        # Sample the LDR on its own fixed schedule; the debounce wants
+        # seconds of consistent readings, so sampling faster than the
+        # lighting can change just burns ADC time, and tying the sample
+        # rate to the frame rate would change the debounce window
+        if time.ticks_diff(now_ms, last_ldr_ms) >= LDR_INTERVAL_MS:
+            last_ldr_ms = now_ms
+            dark = ldr.read_u16() > LDR_THRESHOLD # True if ldr value is read as high
+            if dark:
+                consecutive_light_count = 0  # Reset counter if reading goes above threshold
+                consecutive_dark_count += 1
+            else:
+                consecutive_light_count += 1
+                consecutive_dark_count = 0
+            consistent_dark = consecutive_dark_count >= CONSECUTIVE_COUNT
+            consistent_light = consecutive_light_count >= CONSECUTIVE_COUNT
 
-        if is_within_time_range(start_time, end_time, adjusted_time):
+        current_time = time.localtime()
+        # Only the adjusted hour and minute matter here, so add the
+        # offset with integer math instead of the mktime/localtime
+        # round-trip adjust_time_with_offset does (two heavyweight C
+        # calls and a fresh 9-tuple per iteration)
+        adj_h = (current_time[3] + timezone_offset) % 24
+        adj_m = current_time[4]
+
+        log_due = time.ticks_diff(now_ms, last_log_ms) >= LOG_EVERY_MS
+        if log_due:
+            last_log_ms = now_ms
+            log_msg(f"it's currently: {adj_h}:{adj_m}")
+            _flush_logs()
+            # Re-sync the RTC every few hours: cheap crystals drift by
+            # minutes over a day and the display window check depends on
+            # the clock. Piggybacks on the already rate-limited log tick
+            if time.ticks_diff(now_ms, last_ntp_ms) >= NTP_RESYNC_MS:
+                last_ntp_ms = now_ms
+                try:
+                    set_ntp_time_with_retries(retries=2)
+                    # The UTC offset may have crossed a DST boundary
+                    # since boot; the cache's short TTL means this picks
+                    # up the change without hitting the API every time
+                    new_offset = load_cached_offset(timezone)
+                    if new_offset is None:
+                        new_offset = get_timezone_offset(timezone)
+                        if new_offset is not None:
+                            save_cached_offset(timezone, new_offset)
+                    if new_offset is not None:
+                        timezone_offset = new_offset
+                except Exception as e:
+                    log_error(f"Periodic NTP resync failed: {e}")
+
+        if is_within_minutes(start_minutes, end_minutes, adj_h * 60 + adj_m):
             
-            if iteration_count % check_every == 0:
+            if log_due:
                 log_msg('-> lights on!')
 
             if consistent_dark: #and not bedtime:  # Darkness detected
@@ -500,13 +712,14 @@ def main():
                 if  consistent_light:  # bedtime or
                     lightsout(np)
         else:
-            if iteration_count % check_every == 0:  
+            if log_due:
                 log_msg('-> lights off!')
             lightsout(np)
 
         if consistent_light: #and bedtime:
             # It has been light for multiple consecutive readings following a bedtime button press
             log_msg('Looks like morning. Resetting...')
+            _flush_logs()
             reset()
             current_date = get_local_time_with_retries(timezone)
             log_msg(f"Current local date: {current_date}")
@@ -518,21 +731,22 @@ def main():
             UseCustomColors = light_settings[4]
             start_time = light_settings[5]
             end_time = light_settings[6]
+            start_minutes = time_to_minutes(start_time)
+            end_minutes = time_to_minutes(end_time)
             sleeps = days_between_dates(current_date, special_day)
             start_from_day_tuple = string_to_date_tuple(start_from_day)
             countdown_days = abs(days_between_dates(start_from_day_tuple, special_day))
 
 
-        if dark:
-            consecutive_light_count = 0  # Reset counter if reading goes above threshold
-            consecutive_dark_count += 1
+        # Sleep until the next frame deadline instead of spinning the
+        # CPU flat out between strip updates
+        next_frame_ms = time.ticks_add(next_frame_ms, FRAME_MS)
+        sleep_ms = time.ticks_diff(next_frame_ms, time.ticks_ms())
+        if sleep_ms > 0:
+            time.sleep_ms(sleep_ms)
         else:
-            consecutive_light_count += 1
-            consecutive_dark_count = 0
-        consistent_dark = consecutive_dark_count >= CONSECUTIVE_COUNT
-        consistent_light = consecutive_light_count >= CONSECUTIVE_COUNT
-
-        iteration_count += 1
+            # Fell behind (e.g. a network refresh); restart the schedule
+            next_frame_ms = time.ticks_ms()
 
 
 